@@ -11,6 +11,17 @@ import { registerDiagnosticsTools } from './tools/diagnostics-tools';
 import { registerSymbolTools } from './tools/symbol-tools';
 import { logger } from './utils/logger';
 
+// Serialized once at module load; both unsupported-method handlers return the
+// same static body, so there is no need to re-stringify it per request
+const METHOD_NOT_ALLOWED_BODY = JSON.stringify({
+    jsonrpc: "2.0",
+    error: {
+        code: -32000,
+        message: "Method not allowed."
+    },
+    id: null
+});
+
 export interface ToolConfiguration {
     file: boolean;
     edit: boolean;
@@ -214,26 +225,12 @@ export class MCPServer {
         // Handle unsupported methods
         this.app.get('/mcp', async (req: Request, res: Response) => {
             logger.info('Received GET MCP request');
-            res.writeHead(405).end(JSON.stringify({
-                jsonrpc: "2.0",
-                error: {
-                    code: -32000,
-                    message: "Method not allowed."
-                },
-                id: null
-            }));
+            res.writeHead(405).end(METHOD_NOT_ALLOWED_BODY);
         });
 
         this.app.delete('/mcp', async (req: Request, res: Response) => {
             logger.info('Received DELETE MCP request');
-            res.writeHead(405).end(JSON.stringify({
-                jsonrpc: "2.0",
-                error: {
-                    code: -32000,
-                    message: "Method not allowed."
-                },
-                id: null
-            }));
+            res.writeHead(405).end(METHOD_NOT_ALLOWED_BODY);
         });
 
         // Handle OPTIONS requests for CORS
@@ -333,30 +330,36 @@ export class MCPServer {
                 logger.info('[MCPServer.stop] Closing HTTP server (with timeout)');
                 const httpServerCloseStart = Date.now();
                 
-                await Promise.race([
-                    // Normal close operation
-                    new Promise<void>((resolve, reject) => {
-                        this.httpServer!.close((err) => {
-                            const httpCloseTime = Date.now() - httpServerCloseStart;
-                            if (err) {
-                                logger.error(`[MCPServer.stop] HTTP server closed with error: ${err.message} (took ${httpCloseTime}ms)`);
-                                reject(err);
-                            } else {
-                                logger.info(`[MCPServer.stop] HTTP server closed successfully (took ${httpCloseTime}ms)`);
+                let forceCloseTimer: ReturnType<typeof setTimeout> | undefined;
+                try {
+                    await Promise.race([
+                        // Normal close operation
+                        new Promise<void>((resolve, reject) => {
+                            this.httpServer!.close((err) => {
+                                const httpCloseTime = Date.now() - httpServerCloseStart;
+                                if (err) {
+                                    logger.error(`[MCPServer.stop] HTTP server closed with error: ${err.message} (took ${httpCloseTime}ms)`);
+                                    reject(err);
+                                } else {
+                                    logger.info(`[MCPServer.stop] HTTP server closed successfully (took ${httpCloseTime}ms)`);
+                                    resolve();
+                                }
+                            });
+                        }),
+
+                        // Timeout fallback
+                        new Promise<void>((resolve) => {
+                            forceCloseTimer = setTimeout(() => {
+                                logger.warn(`[MCPServer.stop] HTTP server close timed out after ${forceTimeout}ms - forcing close`);
+                                // We resolve anyway to continue with the shutdown process
                                 resolve();
-                            }
-                        });
-                    }),
-                    
-                    // Timeout fallback
-                    new Promise<void>((resolve) => {
-                        setTimeout(() => {
-                            logger.warn(`[MCPServer.stop] HTTP server close timed out after ${forceTimeout}ms - forcing close`);
-                            // We resolve anyway to continue with the shutdown process
-                            resolve();
-                        }, forceTimeout);
-                    })
-                ]);
+                            }, forceTimeout);
+                        })
+                    ]);
+                } finally {
+                    // Don't leave the fallback timer pending after a clean close
+                    clearTimeout(forceCloseTimer);
+                }
             }
 
             // Rest of the shutdown process...
@@ -148,20 +148,23 @@ function formatDiagnostics(
         return 'No issues found.';
     }
     
-    let output = `Found ${totalIssues} issue(s):\n\n`;
-    
+    // Collect per-issue blocks and join once; += in a loop re-copies the
+    // accumulated string for every issue in large workspaces
+    const blocks: string[] = [`Found ${totalIssues} issue(s):\n\n`];
+
     for (const issue of result) {
-        output += `${issue.severity}: ${issue.file}:${issue.line}:${issue.column}\n`;
-        output += `  ${issue.message}\n`;
-        
+        let block = `${issue.severity}: ${issue.file}:${issue.line}:${issue.column}\n`;
+        block += `  ${issue.message}\n`;
+
         if (includeSource && issue.source) {
-            output += `  Source: ${issue.source}\n`;
+            block += `  Source: ${issue.source}\n`;
         }
-        
-        output += '\n';
+
+        block += '\n';
+        blocks.push(block);
     }
-    
-    return output;
+
+    return blocks.join('');
 }
 
 /**
@@ -199,8 +202,8 @@ export function registerDiagnosticsTools(server: McpServer): void {
                     content: [
                         {
                             type: 'text',
-                            text: format === 'json' 
-                                ? JSON.stringify(formattedResult, null, 2) 
+                            text: format === 'json'
+                                ? JSON.stringify(formattedResult)
                                 : formattedResult as string
                         }
                     ]
@@ -12,6 +12,8 @@ export type FileListingResult = Array<{
 }>;
 
 const DEFAULT_MAX_CHARACTERS = 100000;
+// Bounds both the traversal work and the size of the listing payload
+const DEFAULT_MAX_LIST_ENTRIES = 5000;
 const DEFAULT_IGNORED_DIRS = new Set([
   // Node.js / frontend
   "node_modules", "bower_components", ".yarn", ".pnpm-store", ".pnp", ".pnp.js",
@@ -81,8 +83,9 @@ async function openWorkspaceForFile(filePath: string): Promise<void> {
   let folder: string;
 
   try {
-    if (fs.existsSync(filePath)) {
-      const stats = fs.statSync(filePath);
+    // Async stat so the extension host isn't blocked while opening workspaces
+    const stats = await fs.promises.stat(filePath).catch(() => undefined);
+    if (stats) {
       if (stats.isFile()) {
         folder = path.dirname(filePath);
       } else {
@@ -104,7 +107,8 @@ async function openWorkspaceForFile(filePath: string): Promise<void> {
   }
 
   // Ensure folder exists
-  if (!fs.existsSync(folder)) {
+  const folderStats = await fs.promises.stat(folder).catch(() => undefined);
+  if (!folderStats) {
     logger.warn(`Folder ${folder} doesn't exist. Using current working directory.`);
     folder = process.cwd();
   }
@@ -132,12 +136,19 @@ async function openWorkspaceForFile(filePath: string): Promise<void> {
 export async function listWorkspaceFiles(
   workspacePath: string,
   recursive: boolean = false,
-  ignored: Set<string> = DEFAULT_IGNORED_DIRS
+  ignored: Set<string> = DEFAULT_IGNORED_DIRS,
+  maxEntries: number = DEFAULT_MAX_LIST_ENTRIES
 ): Promise<FileListingResult> {
   const root = workspaceRootUri();
   const targetUri = vscode.Uri.joinPath(root, workspacePath);
+  let entryCount = 0;
 
   async function processDirectory(dirUri: vscode.Uri, currentPath = ""): Promise<FileListingResult> {
+    // Stop descending once the cap is reached instead of walking the whole tree
+    if (entryCount >= maxEntries) {
+      return [];
+    }
+
     let entries: [string, vscode.FileType][];
     try {
       entries = await vscode.workspace.fs.readDirectory(dirUri);
@@ -146,23 +157,31 @@ export async function listWorkspaceFiles(
       return [];
     }
 
-    const result: FileListingResult = [];
+    // Each entry contributes its own record plus, for directories, a subtree
+    // walked concurrently with its siblings; resolving the parts in order
+    // keeps the depth-first listing shape of the serial version
+    const parts: (FileListingResult | Promise<FileListingResult>)[] = [];
     for (const [name, type] of entries) {
       if (ignored.has(name)) continue;
+      if (entryCount >= maxEntries) break;
       const entryPath = currentPath ? path.join(currentPath, name) : name;
       const itemType: "file" | "directory" = type & vscode.FileType.Directory ? "directory" : "file";
-      result.push({ path: entryPath, type: itemType });
+      parts.push([{ path: entryPath, type: itemType }]);
+      entryCount++;
 
       if (recursive && itemType === "directory") {
         const subDirUri = vscode.Uri.joinPath(dirUri, name);
-        const subEntries = await processDirectory(subDirUri, entryPath);
-        result.push(...subEntries);
+        parts.push(processDirectory(subDirUri, entryPath));
       }
     }
-    return result;
+
+    const resolved = await Promise.all(parts);
+    return resolved.flat();
   }
 
-  return await processDirectory(targetUri);
+  const result = await processDirectory(targetUri);
+  // Concurrent subtrees may slightly overshoot the shared counter; enforce the cap
+  return result.length > maxEntries ? result.slice(0, maxEntries) : result;
 }
 
 /**
@@ -197,12 +216,60 @@ export async function readWorkspaceFile(
   return textContent;
 }
 
+// In-memory listings of the fallback search roots. Re-walking the disk for
+// every query repeats an expensive scan whose results rarely change, so each
+// root is indexed once and reused until the TTL expires.
+const FILE_INDEX_TTL_MS = 60000;
+const fileIndexCache = new Map<string, { files: string[]; builtAt: number }>();
+
+/**
+ * Build (or reuse) a flat file listing for a search root
+ */
+async function indexSearchPath(searchPath: string): Promise<string[]> {
+  const cached = fileIndexCache.get(searchPath);
+  if (cached && Date.now() - cached.builtAt < FILE_INDEX_TTL_MS) {
+    return cached.files;
+  }
+
+  const files: string[] = [];
+
+  async function walkDirectory(dirPath: string, depth: number = 0): Promise<void> {
+    // Limit search depth to avoid infinite recursion
+    if (depth > 3) return;
+
+    try {
+      // Async readdir keeps the extension host event loop responsive during deep scans
+      const entries = await fs.promises.readdir(dirPath, { withFileTypes: true });
+
+      for (const entry of entries) {
+        const fullPath = path.join(dirPath, entry.name);
+
+        if (entry.isFile()) {
+          files.push(fullPath);
+        } else if (entry.isDirectory() && !DEFAULT_IGNORED_DIRS.has(entry.name)) {
+          await walkDirectory(fullPath, depth + 1);
+        }
+      }
+    } catch (error) {
+      // Silently ignore permission errors and continue
+    }
+  }
+
+  try {
+    await fs.promises.access(searchPath);
+    await walkDirectory(searchPath);
+  } catch (error) {
+    // Root not accessible; cache the empty listing so it isn't retried per query
+  }
+
+  fileIndexCache.set(searchPath, { files, builtAt: Date.now() });
+  return files;
+}
+
 /**
  * Recursively find files by name across the entire filesystem (starting from common locations)
  */
 async function findFilesInFileSystem(targetName: string): Promise<string[]> {
-  const found: string[] = [];
-
   // Common search locations
   const searchPaths = [
     process.cwd(),
@@ -222,36 +289,19 @@ async function findFilesInFileSystem(targetName: string): Promise<string[]> {
     searchPaths.push(path.join(process.env.USERPROFILE, 'Documents'));
   }
 
-  async function walkDirectory(dirPath: string, depth: number = 0): Promise<void> {
-    // Limit search depth to avoid infinite recursion
-    if (depth > 3) return;
-
-    try {
-      const entries = fs.readdirSync(dirPath, { withFileTypes: true });
-
-      for (const entry of entries) {
-        const fullPath = path.join(dirPath, entry.name);
+  // Index the roots in parallel, then match against the in-memory listings
+  const listings = await Promise.all(searchPaths.map(indexSearchPath));
 
-        if (entry.isFile() && (entry.name === targetName || entry.name.includes(targetName))) {
-          found.push(fullPath);
-        } else if (entry.isDirectory() && !DEFAULT_IGNORED_DIRS.has(entry.name)) {
-          await walkDirectory(fullPath, depth + 1);
-        }
+  const found: string[] = [];
+  for (const files of listings) {
+    for (const fullPath of files) {
+      const name = path.basename(fullPath);
+      if (name === targetName || name.includes(targetName)) {
+        found.push(fullPath);
       }
-    } catch (error) {
-      // Silently ignore permission errors and continue
     }
   }
 
-  // Search in parallel across different root paths
-  await Promise.all(
-    searchPaths.map(async (searchPath) => {
-      if (fs.existsSync(searchPath)) {
-        await walkDirectory(searchPath);
-      }
-    })
-  );
-
   // Remove duplicates and sort
   return [...new Set(found)].sort();
 }
@@ -279,17 +329,21 @@ export async function findFilesRecursively(
         return;
       }
 
+      const subdirWalks: Promise<void>[] = [];
       for (const [name, type] of entries) {
         if (ignored.has(name)) continue;
         const entryRel = relPrefix ? path.join(relPrefix, name) : name;
         const entryUri = vscode.Uri.joinPath(dirUri, name);
 
         if (type & vscode.FileType.Directory) {
-          await walk(entryUri, entryRel);
+          subdirWalks.push(walk(entryUri, entryRel));
         } else if (name === targetName || entryRel.includes(targetName)) {
           found.push(entryRel);
         }
       }
+
+      // Walk sibling directories concurrently instead of one after another
+      await Promise.all(subdirWalks);
     }
 
     await walk(startUri, startPath === "." ? "" : startPath);
@@ -314,8 +368,12 @@ export function registerFileTools(server: McpServer): void {
   server.tool(
     "list_files_code",
     "Lists files in workspace",
-    { path: z.string(), recursive: z.boolean().optional().default(false) },
-    async ({ path: workspacePath, recursive = false }) => {
+    {
+      path: z.string(),
+      recursive: z.boolean().optional().default(false),
+      maxEntries: z.number().optional().default(DEFAULT_MAX_LIST_ENTRIES).describe("Maximum number of entries to return before the listing is truncated")
+    },
+    async ({ path: workspacePath, recursive = false, maxEntries = DEFAULT_MAX_LIST_ENTRIES }) => {
       try {
         // Ensure workspace is ready
         const isReady = await waitForWorkspace();
@@ -323,9 +381,17 @@ export function registerFileTools(server: McpServer): void {
           throw new Error("Workspace not initialized");
         }
 
-        const files = await listWorkspaceFiles(workspacePath, recursive);
+        const files = await listWorkspaceFiles(workspacePath, recursive, DEFAULT_IGNORED_DIRS, maxEntries);
         await focusWorkspaceWindow();
-        return { content: [{ type: "text", text: JSON.stringify(files, null, 2) }] };
+        const content: { type: "text"; text: string }[] = [
+          // Compact serialization: pretty-printing large listings roughly doubles
+          // both the stringify cost and the payload size
+          { type: "text", text: JSON.stringify(files) }
+        ];
+        if (files.length >= maxEntries) {
+          content.push({ type: "text", text: `Listing truncated at ${maxEntries} entries. Narrow the path or raise maxEntries to see more.` });
+        }
+        return { content };
       } catch (error) {
         logger.error(`Error listing files: ${error}`);
         throw error;
@@ -386,7 +452,7 @@ export function registerFileTools(server: McpServer): void {
                 matches: [],
                 message: `File '${targetName}' not found. Opened default workspace at: ${process.cwd()}`,
                 workspaceOpened: process.cwd()
-              }, null, 2)
+              })
             }]
           };
         } else if (matches.length === 1) {
@@ -402,7 +468,7 @@ export function registerFileTools(server: McpServer): void {
                 selectedFile: matches[0],
                 message: `Found single file: ${matches[0]}. Workspace opened.`,
                 workspaceOpened: path.dirname(matches[0])
-              }, null, 2)
+              })
             }]
           };
         } else {
@@ -415,7 +481,7 @@ export function registerFileTools(server: McpServer): void {
                 matches: matches,
                 message: `Multiple files found with name '${targetName}'. Please select one:`,
                 instruction: "Use 'open_workspace_for_file' tool with the specific path you want to work with."
-              }, null, 2)
+              })
             }]
           };
         }
@@ -437,9 +503,8 @@ export function registerFileTools(server: McpServer): void {
       try {
         logger.info(`Opening workspace for file: ${filePath}`);
         await openWorkspaceForFile(filePath);
-        const workspaceDir = fs.existsSync(filePath) && fs.statSync(filePath).isFile()
-          ? path.dirname(filePath)
-          : filePath;
+        const stats = await fs.promises.stat(filePath).catch(() => undefined);
+        const workspaceDir = stats?.isFile() ? path.dirname(filePath) : filePath;
 
         return {
           content: [{
@@ -52,24 +52,27 @@ export async function executeShellCommand(
     }
   }
 
+  let timeoutId: ReturnType<typeof setTimeout> | undefined;
   const timeoutPromise = new Promise<never>((_, reject) => {
-    setTimeout(() => reject(new Error(`Command timed out after ${timeout}ms`)), timeout);
+    timeoutId = setTimeout(() => reject(new Error(`Command timed out after ${timeout}ms`)), timeout);
   });
 
   const executionPromise = async (): Promise<{ output: string }> => {
     // If shellIntegration exists, use it to execute and read the output stream.
     if ((terminal as any).shellIntegration) {
       const execution = (terminal as any).shellIntegration!.executeCommand(fullCommand);
-      let output = '';
+      // Collect chunks and join once at the end; += re-copies the whole
+      // accumulated string on every chunk for long-running commands
+      const chunks: string[] = [];
       try {
         const outputStream = (execution as any).read();
         for await (const chunk of outputStream) {
-          output += chunk;
+          chunks.push(chunk);
         }
       } catch (err) {
         throw new Error(`Failed to read command output: ${err}`);
       }
-      return { output };
+      return { output: chunks.join('') };
     }
 
     // Fallback: send command text to terminal, but we cannot reliably capture output.
@@ -80,7 +83,13 @@ export async function executeShellCommand(
     });
   };
 
-  return Promise.race([executionPromise(), timeoutPromise]);
+  try {
+    return await Promise.race([executionPromise(), timeoutPromise]);
+  } finally {
+    // Clear the timer once the race settles; otherwise every completed command
+    // leaves a pending timeout (and its rejection) behind for the full window
+    clearTimeout(timeoutId);
+  }
 }
 
 /**
@@ -140,7 +149,8 @@ export function registerShellTools(server: McpServer, terminal?: vscode.Terminal
        console.log("Focusing workspace window");
           await vscode.commands.executeCommand('workbench.action.focusActiveEditorGroup');
           console.log("Workspace window focused");
-        return { content: [{ type: 'text', text: JSON.stringify(files, null, 2) }] };
+        // Compact serialization keeps large directory listings cheap to build and send
+        return { content: [{ type: 'text', text: JSON.stringify(files) }] };
       } catch (err) {
         return { content: [{ type: 'text', text: `Failed to list directory ${dir}: ${String(err)}` }] };
       }
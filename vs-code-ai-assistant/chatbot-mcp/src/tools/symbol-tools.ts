@@ -5,6 +5,14 @@ import { CallToolResult } from "@modelcontextprotocol/sdk/types.js";
 import * as path from 'path';
 import * as fs from 'fs';
 import { logger } from '../utils/logger';
+import { LruCache } from '../utils/lru-cache';
+
+// Document symbol results keyed by file URI, mtime, size and maxDepth, so
+// repeated outline requests for an unchanged file skip the provider round trip
+const documentSymbolCache = new LruCache<Awaited<ReturnType<typeof getDocumentSymbols>>>(64, 30000);
+
+// Hoisted so the pattern isn't rebuilt every time a file preview is sliced into lines
+const LINE_SPLIT_REGEX = /\r?\n/;
 
 /**
  * Convert a symbol kind to a string representation
@@ -82,7 +90,7 @@ async function getPreview(uri: vscode.Uri, line?: number): Promise<string | unde
             try {
                 const content = await vscode.workspace.fs.readFile(uri);
                 const text = Buffer.from(content).toString('utf8');
-                const lines = text.split(/\r?\n/);
+                const lines = text.split(LINE_SPLIT_REGEX);
                 
                 if (line >= 0 && line < lines.length) {
                     return lines[line].trim();
@@ -429,14 +437,19 @@ export function registerSymbolTools(server: McpServer): void {
                     }
                     
                     resultText += ":\n\n";
-                    
+
+                    // Build per-symbol entries and join once instead of
+                    // re-copying the accumulated string on every iteration
+                    const symbolEntries: string[] = [];
                     for (const symbol of result.symbols) {
-                        resultText += `${symbol.name} (${symbol.kind})`;
+                        let entry = `${symbol.name} (${symbol.kind})`;
                         if (symbol.containerName) {
-                            resultText += ` in ${symbol.containerName}`;
+                            entry += ` in ${symbol.containerName}`;
                         }
-                        resultText += `\nLocation: ${symbol.location}\n\n`;
+                        entry += `\nLocation: ${symbol.location}\n\n`;
+                        symbolEntries.push(entry);
                     }
+                    resultText += symbolEntries.join('');
                 }
                 
                  console.log("Focusing workspace window");
@@ -473,31 +486,31 @@ export function registerSymbolTools(server: McpServer): void {
             line: z.number().describe('The line number of the symbol (1-based)'),
             symbol: z.string().describe('The symbol name to look for on the specified line')
         },
-        async ({ path, line, symbol }): Promise<CallToolResult> => {
-            logger.info(`[get_symbol_definition_code] Tool called with path="${path}", line=${line}, symbol="${symbol}"`);
-            
+        async ({ path: filePath, line, symbol }): Promise<CallToolResult> => {
+            logger.info(`[get_symbol_definition_code] Tool called with path="${filePath}", line=${line}, symbol="${symbol}"`);
+
             // Convert 1-based input to 0-based for VS Code API
             const zeroBasedLine = line - 1;
             try {
                 if (!vscode.workspace.workspaceFolders) {
                     throw new Error('No workspace folder open');
                 }
-                
+
                 const workspaceRoot = vscode.workspace.workspaceFolders[0].uri.fsPath;
-                const fullPath = require('path').resolve(workspaceRoot, path);
+                const fullPath = path.resolve(workspaceRoot, filePath);
                 const uri = vscode.Uri.file(fullPath);
-                
+
                 // Check if file exists
                 try {
                     await vscode.workspace.fs.stat(uri);
                 } catch (error) {
-                    throw new Error(`File not found: ${path}`);
+                    throw new Error(`File not found: ${filePath}`);
                 }
-                
+
                 // Get the content of the specified line
                 const lineText = await getLineText(uri, zeroBasedLine);
                 if (!lineText) {
-                    throw new Error(`Line ${line} not found in file: ${path}`);
+                    throw new Error(`Line ${line} not found in file: ${filePath}`);
                 }
                 
                 // Find the character position of the symbol in the line
@@ -507,7 +520,7 @@ export function registerSymbolTools(server: McpServer): void {
                         content: [
                             {
                                 type: 'text',
-                                text: `Symbol "${symbol}" not found on line ${line} in file: ${path}`
+                                text: `Symbol "${symbol}" not found on line ${line} in file: ${filePath}`
                             }
                         ]
                     };
@@ -522,9 +535,9 @@ export function registerSymbolTools(server: McpServer): void {
                 let resultText: string;
                 
                 if (hoverResult.hovers.length === 0) {
-                    resultText = `No definition information found for symbol "${symbol}" at ${path}:${line}:${character}.`;
+                    resultText = `No definition information found for symbol "${symbol}" at ${filePath}:${line}:${character}.`;
                 } else {
-                    resultText = `Definition information for symbol "${symbol}" at ${path}:${line}:${character}:\n\n`;
+                    resultText = `Definition information for symbol "${symbol}" at ${filePath}:${line}:${character}:\n\n`;
                     
                     for (const hover of hoverResult.hovers) {
                         // Add preview if available
@@ -577,34 +590,43 @@ export function registerSymbolTools(server: McpServer): void {
             path: z.string().describe('The path to the file to analyze (relative to workspace)'),
             maxDepth: z.number().optional().describe('Maximum nesting depth to display (optional)')
         },
-        async ({ path, maxDepth }): Promise<CallToolResult> => {
-            logger.info(`[get_document_symbols_code] Tool called with path="${path}", maxDepth=${maxDepth}`);
-            
+        async ({ path: filePath, maxDepth }): Promise<CallToolResult> => {
+            logger.info(`[get_document_symbols_code] Tool called with path="${filePath}", maxDepth=${maxDepth}`);
+
             try {
                 if (!vscode.workspace.workspaceFolders) {
                     throw new Error('No workspace folder open');
                 }
-                
+
                 const workspaceRoot = vscode.workspace.workspaceFolders[0].uri.fsPath;
-                const fullPath = require('path').resolve(workspaceRoot, path);
+                const fullPath = path.resolve(workspaceRoot, filePath);
                 const uri = vscode.Uri.file(fullPath);
-                
+
                 // Check if file exists
+                let stat: vscode.FileStat;
                 try {
-                    await vscode.workspace.fs.stat(uri);
+                    stat = await vscode.workspace.fs.stat(uri);
                 } catch (error) {
-                    throw new Error(`File not found: ${path}`);
+                    throw new Error(`File not found: ${filePath}`);
+                }
+
+                const cacheKey = `${uri.toString()}:${stat.mtime}:${stat.size}:${maxDepth ?? 'all'}`;
+                let result = documentSymbolCache.get(cacheKey);
+
+                if (result) {
+                    logger.info('[get_document_symbols_code] Returning cached document symbols');
+                } else {
+                    logger.info('[get_document_symbols_code] Getting document symbols');
+                    result = await getDocumentSymbols(uri, maxDepth);
+                    documentSymbolCache.set(cacheKey, result);
                 }
-                
-                logger.info('[get_document_symbols_code] Getting document symbols');
-                const result = await getDocumentSymbols(uri, maxDepth);
                 
                 let resultText: string;
                 
                 if (result.symbols.length === 0) {
-                    resultText = `No symbols found in file: ${path}`;
+                    resultText = `No symbols found in file: ${filePath}`;
                 } else {
-                    resultText = `Document symbols for ${path} (${result.total} total symbols):\n\n`;
+                    resultText = `Document symbols for ${filePath} (${result.total} total symbols):\n\n`;
                     
                     // Add summary by kind
                     const kindSummary = Object.entries(result.totalByKind)
@@ -612,23 +634,27 @@ export function registerSymbolTools(server: McpServer): void {
                         .join(', ');
                     resultText += `Summary: ${kindSummary}\n\n`;
                     
-                    // Add hierarchical symbol listing
+                    // Add hierarchical symbol listing, joining once at the end
+                    // rather than growing the string symbol by symbol
+                    const symbolEntries: string[] = [];
                     for (const symbol of result.symbols) {
                         const indent = '  '.repeat(symbol.depth);
-                        resultText += `${indent}${symbol.name} (${symbol.kind})`;
-                        
+                        let entry = `${indent}${symbol.name} (${symbol.kind})`;
+
                         if (symbol.detail) {
-                            resultText += ` - ${symbol.detail}`;
+                            entry += ` - ${symbol.detail}`;
                         }
-                        
-                        resultText += `\n${indent}  Range: ${symbol.range.start.line}:${symbol.range.start.character}-${symbol.range.end.line}:${symbol.range.end.character}`;
-                        
+
+                        entry += `\n${indent}  Range: ${symbol.range.start.line}:${symbol.range.start.character}-${symbol.range.end.line}:${symbol.range.end.character}`;
+
                         if (symbol.children !== undefined) {
-                            resultText += ` | Children: ${symbol.children}`;
+                            entry += ` | Children: ${symbol.children}`;
                         }
-                        
-                        resultText += '\n\n';
+
+                        entry += '\n\n';
+                        symbolEntries.push(entry);
                     }
+                    resultText += symbolEntries.join('');
                 }
                 
                  console.log("Focusing workspace window");
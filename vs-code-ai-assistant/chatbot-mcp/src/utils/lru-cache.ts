@@ -0,0 +1,64 @@
+/**
+ * A small least-recently-used cache with time-based expiry.
+ * Used to memoize expensive provider round trips so repeated requests
+ * for unchanged inputs can skip the underlying call entirely.
+ */
+export class LruCache<V> {
+    private entries = new Map<string, { value: V; storedAt: number }>();
+
+    /**
+     * @param maxEntries Maximum number of entries kept before the least
+     *                   recently used one is evicted
+     * @param ttlMs How long a cached value stays valid, in milliseconds
+     */
+    constructor(
+        private maxEntries: number = 64,
+        private ttlMs: number = 30000
+    ) {}
+
+    /**
+     * Look up a cached value. Expired entries are dropped on access.
+     * @param key The cache key
+     * @returns The cached value, or undefined on miss/expiry
+     */
+    public get(key: string): V | undefined {
+        const entry = this.entries.get(key);
+        if (!entry) {
+            return undefined;
+        }
+
+        if (Date.now() - entry.storedAt > this.ttlMs) {
+            this.entries.delete(key);
+            return undefined;
+        }
+
+        // Re-insert so Map iteration order reflects recency of use
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        return entry.value;
+    }
+
+    /**
+     * Store a value, evicting the least recently used entry when full.
+     * @param key The cache key
+     * @param value The value to cache
+     */
+    public set(key: string, value: V): void {
+        if (this.entries.has(key)) {
+            this.entries.delete(key);
+        } else if (this.entries.size >= this.maxEntries) {
+            const oldestKey = this.entries.keys().next().value;
+            if (oldestKey !== undefined) {
+                this.entries.delete(oldestKey);
+            }
+        }
+        this.entries.set(key, { value, storedAt: Date.now() });
+    }
+
+    /**
+     * Drop all cached entries.
+     */
+    public clear(): void {
+        this.entries.clear();
+    }
+}